@@ -0,0 +1,121 @@
+"""
+Бенчмарк разбора страниц поиска музыкальных сайтов.
+
+Сравнивает прежний способ (BeautifulSoup + html.parser по всей странице) с
+текущим extract_songs (быстрый парсер + parse_only) на сохраненных страницах
+и проверяет, что оба дают одинаковый результат.
+
+Страницы - настоящие ответы сайтов, по одной на провайдера:
+    scripts/fixtures/mp3iq.net.html
+    scripts/fixtures/skysound7.com.html
+    ...
+Сохранить их можно тем же путем, которым ходит бот (адрес поиска, заголовки
+и прокси из SEARCH_PROVIDER_CONFIGS), - нужен доступ к сети и прокси из .env:
+    python scripts/bench_extractors.py --fetch "Кино - Группа крови"
+
+Запуск из корня репозитория:
+    python scripts/bench_extractors.py [каталог_со_страницами] [-n ПОВТОРОВ]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# i_m.py при импорте проверяет обязательные переменные окружения
+os.environ.setdefault("TG_IDS", "0")
+os.environ.setdefault("BOT_TOKEN", "123456:bench-dummy-token")
+os.environ.setdefault("GOOGLE_API_KEY", "bench-dummy-key")
+# Не ждем отладчик, даже если DEBUG_MODE=1 задан в .env
+os.environ["DEBUG_MODE"] = "0"
+sys.path.insert(0, str(ROOT / "src"))
+
+import i_m  # noqa: E402
+from bs4 import BeautifulSoup  # noqa: E402
+
+
+def extract_songs_baseline(config: dict, html: str) -> list:
+    """Прежний способ: html.parser по всей странице."""
+    soup = BeautifulSoup(html, "html.parser")
+    parsed_songs = []
+    for item in soup.select(config["item_selector"]):
+        try:
+            song_data = config["extractor_func"](item, config["base_url"])
+        except Exception:
+            continue
+        if song_data and song_data.get("link"):
+            parsed_songs.append(song_data)
+    return parsed_songs
+
+
+def bench(func, config: dict, html: str, repeat: int) -> tuple:
+    result = func(config, html)
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(config, html)
+    return result, (time.perf_counter() - started) / repeat * 1000
+
+
+async def fetch_pages(query: str, fixtures: Path) -> int:
+    """Сохраняет страницы поиска всех провайдеров. Возвращает число сохраненных."""
+    fixtures.mkdir(parents=True, exist_ok=True)
+    i_m.init_http_sessions()
+    saved = 0
+    try:
+        for config in i_m.SEARCH_PROVIDER_CONFIGS:
+            search_url = i_m.build_search_url(config, query)
+            html = await i_m.fetch_search_page(config, search_url)
+            if not html:
+                print(f"{config['name']:<16}  не удалось скачать {search_url}")
+                continue
+            (fixtures / f"{config['name']}.html").write_text(html, encoding="utf-8")
+            print(f"{config['name']:<16}  сохранено {len(html)} символов из {search_url}")
+            saved += 1
+    finally:
+        await i_m.close_http_sessions()
+    return saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("fixtures", nargs="?", default=ROOT / "scripts" / "fixtures", type=Path)
+    parser.add_argument("-n", "--repeat", type=int, default=20)
+    parser.add_argument("--fetch", metavar="ЗАПРОС", help="сначала скачать страницы поиска по запросу")
+    args = parser.parse_args()
+
+    if args.fetch and not asyncio.run(fetch_pages(args.fetch, args.fixtures)):
+        sys.exit("Ни одной страницы не скачано.")
+
+    print(f"Парсер: {i_m.HTML_PARSER}, повторов: {args.repeat}")
+    print(f"{'провайдер':<16}{'треков':>8}{'было, мс':>12}{'стало, мс':>12}{'ускорение':>12}")
+    compared = mismatches = 0
+    for config in i_m.SEARCH_PROVIDER_CONFIGS:
+        fixture = args.fixtures / f"{config['name']}.html"
+        if not fixture.exists():
+            print(f"{config['name']:<16}  нет страницы {fixture}")
+            continue
+        html = fixture.read_text(encoding="utf-8")
+        compared += 1
+
+        old_songs, old_ms = bench(extract_songs_baseline, config, html, args.repeat)
+        new_songs, new_ms = bench(i_m.extract_songs, config, html, args.repeat)
+        new_songs = new_songs or []
+        speedup = old_ms / new_ms if new_ms else 0
+        print(f"{config['name']:<16}{len(new_songs):>8}{old_ms:>12.2f}{new_ms:>12.2f}{speedup:>11.1f}x")
+        if new_songs != old_songs:
+            mismatches += 1
+            print(f"  ! результаты различаются: было {len(old_songs)}, стало {len(new_songs)}")
+
+    i_m.html_parse_executor.shutdown()
+    if not compared:
+        sys.exit("Нет сохраненных страниц - запустите с --fetch.")
+    print("Результаты совпадают" if not mismatches else f"Различий: {mismatches}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()